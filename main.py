@@ -23,8 +23,9 @@ def main():
     # Get user input
     user_input = input("You: ")
 
-    # Start the chatroom
-    chatroom = Chatroom()
+    # Start the chatroom, recording a session trace if LLM_TRACE is set
+    trace = os.getenv("LLM_TRACE", "").lower() in ("1", "true", "yes")
+    chatroom = Chatroom(trace=trace)
     summary = chatroom.start_chat(user_input)
 
     print("\n" + "=" * 50)
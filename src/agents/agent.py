@@ -3,6 +3,7 @@ import os
 import openai
 import anthropic
 from abc import ABC, abstractmethod
+from src.tracing.tracer import Tracer
 
 
 class Agent(ABC):
@@ -26,6 +27,8 @@ class Agent(ABC):
             api_key=os.getenv("ANTHROPIC_API_KEY", "")
         )
         self.use_backup = False
+        # Disabled by default; the chatroom hands agents its session tracer
+        self.tracer = Tracer(enabled=False)
 
     def call_llm(
         self, system_prompt: str, user_message: str, temperature: float = 0.7
@@ -41,35 +44,45 @@ class Agent(ABC):
         Returns:
             The LLM's response as a string
         """
-        try:
-            if not self.use_backup:
-                # Try OpenAI first
-                response = self.openai_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_message},
-                    ],
-                    temperature=temperature,
-                )
-                return response.choices[0].message.content
-        except Exception as e:
-            print(f"OpenAI API error: {e}")
-            self.use_backup = True
+        with self.tracer.span(
+            "llm_call", "llm", agent=self.name, temperature=temperature
+        ) as span:
+            try:
+                if not self.use_backup:
+                    # Try OpenAI first
+                    with self.tracer.span("openai", "llm", model=self.model):
+                        response = self.openai_client.chat.completions.create(
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {"role": "user", "content": user_message},
+                            ],
+                            temperature=temperature,
+                        )
+                    span["provider"] = "openai"
+                    return response.choices[0].message.content
+            except Exception as e:
+                print(f"OpenAI API error: {e}")
+                self.use_backup = True
+                span["fallback"] = True
 
-        # Fallback to Anthropic if OpenAI fails
-        try:
-            response = self.anthropic_client.messages.create(
-                model="claude-3-sonnet-20240229",
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_message}],
-                temperature=temperature,
-                max_tokens=2000,
-            )
-            return response.content[0].text
-        except Exception as e:
-            print(f"Anthropic API error: {e}")
-            raise Exception("Both OpenAI and Anthropic APIs failed")
+            # Fallback to Anthropic if OpenAI fails
+            span["provider"] = "anthropic"
+            try:
+                with self.tracer.span(
+                    "anthropic", "llm", model="claude-3-sonnet-20240229"
+                ):
+                    response = self.anthropic_client.messages.create(
+                        model="claude-3-sonnet-20240229",
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": user_message}],
+                        temperature=temperature,
+                        max_tokens=2000,
+                    )
+                return response.content[0].text
+            except Exception as e:
+                print(f"Anthropic API error: {e}")
+                raise Exception("Both OpenAI and Anthropic APIs failed")
 
     @abstractmethod
     def process(self, input_data: Any) -> Any:
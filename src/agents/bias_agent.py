@@ -59,17 +59,19 @@ class BiasAgent(Agent):
         # Parse the response into a proper dict
         import json
 
-        try:
-            return json.loads(result)
-        except json.JSONDecodeError:
-            # Fallback if the LLM doesn't return valid JSON
-            return {
-                "perspectives": [
-                    {
-                        "name": "General Perspective",
-                        "description": "Could not parse specific perspectives",
-                        "key_arguments": [],
-                    }
-                ],
-                "num_perspectives": 1,
-            }
+        with self.tracer.span("parse", "parse", agent=self.name) as span:
+            try:
+                return json.loads(result)
+            except json.JSONDecodeError:
+                span["fallback"] = True
+                # Fallback if the LLM doesn't return valid JSON
+                return {
+                    "perspectives": [
+                        {
+                            "name": "General Perspective",
+                            "description": "Could not parse specific perspectives",
+                            "key_arguments": [],
+                        }
+                    ],
+                    "num_perspectives": 1,
+                }
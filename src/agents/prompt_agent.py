@@ -57,20 +57,24 @@ class PromptAgent(Agent):
         # Parse the response
         import json
 
-        try:
-            prompts = json.loads(result)
-            if isinstance(prompts, list):
-                return prompts
-            elif isinstance(prompts, dict) and "prompts" in prompts:
-                return prompts["prompts"]
-            else:
-                raise ValueError("Unexpected format in prompt agent response")
-        except (json.JSONDecodeError, ValueError):
-            # Fallback
-            return [
-                {
-                    "agent_name": p["name"],
-                    "system_prompt": f"You are an expert representing the {p['name']} perspective on {topic}. Your view is: {p['description']}. Discuss this topic thoughtfully while staying true to your perspective.",
-                }
-                for p in perspectives
-            ]
+        with self.tracer.span("parse", "parse", agent=self.name) as span:
+            try:
+                prompts = json.loads(result)
+                if isinstance(prompts, list):
+                    return prompts
+                elif isinstance(prompts, dict) and "prompts" in prompts:
+                    return prompts["prompts"]
+                else:
+                    raise ValueError(
+                        "Unexpected format in prompt agent response"
+                    )
+            except (json.JSONDecodeError, ValueError):
+                span["fallback"] = True
+                # Fallback
+                return [
+                    {
+                        "agent_name": p["name"],
+                        "system_prompt": f"You are an expert representing the {p['name']} perspective on {topic}. Your view is: {p['description']}. Discuss this topic thoughtfully while staying true to your perspective.",
+                    }
+                    for p in perspectives
+                ]
@@ -45,31 +45,33 @@ class TriageAgent(Agent):
         import json
         import re
 
-        # Attempt to find JSON in the response
-        json_match = re.search(
-            r"(\{.*\})", result.replace("\n", " "), re.DOTALL
-        )
+        with self.tracer.span("parse", "parse", agent=self.name) as span:
+            # Attempt to find JSON in the response
+            json_match = re.search(
+                r"(\{.*\})", result.replace("\n", " "), re.DOTALL
+            )
 
-        try:
-            if json_match:
-                parsed_result = json.loads(json_match.group(1))
-            else:
-                parsed_result = json.loads(result)
+            try:
+                if json_match:
+                    parsed_result = json.loads(json_match.group(1))
+                else:
+                    parsed_result = json.loads(result)
 
-            # Ensure questions is always a list
-            if isinstance(parsed_result.get("questions"), str):
-                parsed_result["questions"] = [parsed_result["questions"]]
+                # Ensure questions is always a list
+                if isinstance(parsed_result.get("questions"), str):
+                    parsed_result["questions"] = [parsed_result["questions"]]
 
-            return parsed_result
-        except json.JSONDecodeError:
-            # Fallback with manual extraction
-            return {
-                "topic": self._extract_topic(result) or "Undefined topic",
-                "questions": [
-                    self._extract_question(result)
-                    or "No specific question identified"
-                ],
-            }
+                return parsed_result
+            except json.JSONDecodeError:
+                span["fallback"] = True
+                # Fallback with manual extraction
+                return {
+                    "topic": self._extract_topic(result) or "Undefined topic",
+                    "questions": [
+                        self._extract_question(result)
+                        or "No specific question identified"
+                    ],
+                }
 
     def _extract_topic(self, text: str) -> str:
         """Extract topic from text when JSON parsing fails."""
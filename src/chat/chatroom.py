@@ -7,42 +7,66 @@ from src.agents.bias_agent import BiasAgent
 from src.agents.prompt_agent import PromptAgent
 from src.agents.chat_agent import ChatAgent
 from src.agents.summary_agent import SummaryAgent
+from src.tracing.tracer import Tracer, ChromeTraceFileExporter
 
 
 class Chatroom:
     """Main controller for the LLM chatroom system."""
 
-    def __init__(self) -> None:
+    def __init__(self, trace: bool = False) -> None:
+        """
+        Initialize the chatroom.
+
+        Args:
+            trace: Record a timeline of the session and export it as a
+                Chrome trace-event JSON file next to the chat log
+        """
+        self.tracer = Tracer(enabled=trace)
         self.triage_agent = TriageAgent()
         self.bias_agent = BiasAgent()
         self.prompt_agent = PromptAgent()
         self.summary_agent = SummaryAgent()
+        for agent in (
+            self.triage_agent,
+            self.bias_agent,
+            self.prompt_agent,
+            self.summary_agent,
+        ):
+            agent.tracer = self.tracer
         self.chat_agents = []
         self.chat_history = []
         self.topic = ""
         self.log_file = None
+        self.trace_filename = None
 
     def setup_logging(self, topic: str) -> None:
         """Set up logging to a file."""
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        sanitized_topic = "".join([c if c.isalnum() else "_" for c in topic])[
-            :30
-        ]
-        log_dir = "chat_logs"
-        os.makedirs(log_dir, exist_ok=True)
-        log_filename = f"{log_dir}/chat_{sanitized_topic}_{timestamp}.txt"
-        self.log_file = open(log_filename, "w", encoding="utf-8")
-        self.log(
-            f"Chat session started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-        self.log(f"Topic: {topic}\n")
+        with self.tracer.span("setup_logging", "io"):
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            sanitized_topic = "".join(
+                [c if c.isalnum() else "_" for c in topic]
+            )[:30]
+            log_dir = "chat_logs"
+            os.makedirs(log_dir, exist_ok=True)
+            log_filename = (
+                f"{log_dir}/chat_{sanitized_topic}_{timestamp}.txt"
+            )
+            self.trace_filename = (
+                f"{log_dir}/trace_{sanitized_topic}_{timestamp}.json"
+            )
+            self.log_file = open(log_filename, "w", encoding="utf-8")
+            self.log(
+                f"Chat session started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+            self.log(f"Topic: {topic}\n")
 
     def log(self, message: str) -> None:
         """Log a message to the file and print to console."""
-        print(message)
-        if self.log_file:
-            self.log_file.write(message + "\n")
-            self.log_file.flush()  # Ensure it's written immediately
+        with self.tracer.span("log", "io"):
+            print(message)
+            if self.log_file:
+                self.log_file.write(message + "\n")
+                self.log_file.flush()  # Ensure it's written immediately
 
     def start_chat(self, user_input: str) -> str:
         """
@@ -54,101 +78,136 @@ class Chatroom:
         Returns:
             The final summary
         """
+        try:
+            with self.tracer.span("session", "session"):
+                return self._run_chat(user_input)
+        finally:
+            self.export_trace()
+
+    def export_trace(self) -> Optional[str]:
+        """Write the session trace to disk if tracing is enabled."""
+        if not self.tracer.enabled:
+            return None
+        filename = self.trace_filename or (
+            "chat_logs/trace_"
+            f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        path = ChromeTraceFileExporter(filename).export(self.tracer)
+        print(f"Session trace saved to {path}")
+        return path
+
+    def _run_chat(self, user_input: str) -> str:
         # Step 1: Triage Agent extracts topic and questions
-        self.log("🔍 Triage Agent is analyzing the topic...")
-        triage_output = self.triage_agent.process(user_input)
-        self.topic = triage_output["topic"]
-        self.setup_logging(self.topic)
-        self.log(f"Topic identified: {self.topic}")
-        self.log(f"Questions identified: {triage_output['questions']}\n")
+        with self.tracer.span("triage", "stage"):
+            self.log("🔍 Triage Agent is analyzing the topic...")
+            triage_output = self.triage_agent.process(user_input)
+            self.topic = triage_output["topic"]
+            self.setup_logging(self.topic)
+            self.log(f"Topic identified: {self.topic}")
+            self.log(f"Questions identified: {triage_output['questions']}\n")
 
         # Step 2: Bias Agent identifies perspectives
-        self.log("🧠 Bias Agent is identifying perspectives...")
-        bias_output = self.bias_agent.process(triage_output)
-        num_perspectives = bias_output["num_perspectives"]
-        self.log(f"Number of perspectives identified: {num_perspectives}")
-        for i, perspective in enumerate(bias_output["perspectives"]):
-            self.log(f"Perspective {i+1}: {perspective['name']}")
-            self.log(f"  Description: {perspective['description']}")
-            if (
-                "key_arguments" in perspective
-                and perspective["key_arguments"]
-            ):
-                self.log(
-                    f"  Key Arguments: {', '.join(perspective['key_arguments'])}"
-                )
-            self.log("")
+        with self.tracer.span("bias", "stage"):
+            self.log("🧠 Bias Agent is identifying perspectives...")
+            bias_output = self.bias_agent.process(triage_output)
+            num_perspectives = bias_output["num_perspectives"]
+            self.log(f"Number of perspectives identified: {num_perspectives}")
+            for i, perspective in enumerate(bias_output["perspectives"]):
+                self.log(f"Perspective {i+1}: {perspective['name']}")
+                self.log(f"  Description: {perspective['description']}")
+                if (
+                    "key_arguments" in perspective
+                    and perspective["key_arguments"]
+                ):
+                    self.log(
+                        f"  Key Arguments: {', '.join(perspective['key_arguments'])}"
+                    )
+                self.log("")
 
         # Step 3: Prompt Agent creates prompts for Chat Agents
-        self.log("📝 Prompt Agent is creating system prompts...")
-        prompts = self.prompt_agent.process(bias_output, triage_output)
+        with self.tracer.span("prompt", "stage"):
+            self.log("📝 Prompt Agent is creating system prompts...")
+            prompts = self.prompt_agent.process(bias_output, triage_output)
 
         # Step 4: Create Chat Agents
-        self.log("👥 Creating Chat Agents...")
-        self.chat_agents = []
-        for i, prompt_data in enumerate(prompts):
-            agent_name = prompt_data.get("agent_name", f"Agent {i+1}")
-            system_prompt = prompt_data.get("system_prompt", "")
-            self.log(f"Created agent: {agent_name}")
-            self.chat_agents.append(
-                ChatAgent(name=agent_name, system_prompt=system_prompt)
-            )
-        self.log("")
+        with self.tracer.span("create_agents", "stage"):
+            self.log("👥 Creating Chat Agents...")
+            self.chat_agents = []
+            for i, prompt_data in enumerate(prompts):
+                agent_name = prompt_data.get("agent_name", f"Agent {i+1}")
+                system_prompt = prompt_data.get("system_prompt", "")
+                self.log(f"Created agent: {agent_name}")
+                agent = ChatAgent(name=agent_name, system_prompt=system_prompt)
+                agent.tracer = self.tracer
+                self.chat_agents.append(agent)
+            self.log("")
 
         # Step 5: Chat Agents discuss (5 iterations)
-        self.log("💬 Starting discussion...\n")
-
-        # First round - each agent introduces their perspective
-        self.log("--- Initial perspectives ---\n")
-        for agent in self.chat_agents:
-            response = agent.process(
-                [],  # Empty chat history for first messages
-                1,
-                topic=self.topic,
-                question=triage_output.get("questions", [""])[0],
-            )
-            message = {
-                "agent": agent.name,
-                "message": response,
-                "iteration": 1,
-            }
-            self.chat_history.append(message)
-            self.log(f"{agent.name}: {response}\n")
-
-        # Subsequent rounds - agents respond to each other
-        for iteration in range(2, 6):
-            self.log(f"--- Continuing discussion (round {iteration}) ---\n")
-
-            # Randomize the order of agents speaking for more natural flow
-            import random
-
-            speaking_order = list(self.chat_agents)
-            random.shuffle(speaking_order)
-
-            for agent in speaking_order:
-                question = (
-                    triage_output.get("questions", [""])[0]
-                    if isinstance(triage_output.get("questions"), list)
-                    else triage_output.get("questions", "")
-                )
-                response = agent.process(
-                    self.chat_history,
-                    iteration,
-                    topic=self.topic,
-                    question=question,
-                )
-                message = {
-                    "agent": agent.name,
-                    "message": response,
-                    "iteration": iteration,
-                }
-                self.chat_history.append(message)
-                self.log(f"{agent.name}: {response}\n")
+        with self.tracer.span("discussion", "stage"):
+            self.log("💬 Starting discussion...\n")
+
+            # First round - each agent introduces their perspective
+            with self.tracer.span("round", "round", iteration=1):
+                self.log("--- Initial perspectives ---\n")
+                for agent in self.chat_agents:
+                    with self.tracer.span("turn", "turn", agent=agent.name):
+                        response = agent.process(
+                            [],  # Empty chat history for first messages
+                            1,
+                            topic=self.topic,
+                            question=triage_output.get("questions", [""])[0],
+                        )
+                        message = {
+                            "agent": agent.name,
+                            "message": response,
+                            "iteration": 1,
+                        }
+                        self.chat_history.append(message)
+                        self.log(f"{agent.name}: {response}\n")
+
+            # Subsequent rounds - agents respond to each other
+            for iteration in range(2, 6):
+                with self.tracer.span("round", "round", iteration=iteration):
+                    self.log(
+                        f"--- Continuing discussion (round {iteration}) ---\n"
+                    )
+
+                    # Randomize the order of agents speaking for more natural flow
+                    import random
+
+                    speaking_order = list(self.chat_agents)
+                    random.shuffle(speaking_order)
+
+                    for agent in speaking_order:
+                        with self.tracer.span(
+                            "turn", "turn", agent=agent.name
+                        ):
+                            question = (
+                                triage_output.get("questions", [""])[0]
+                                if isinstance(
+                                    triage_output.get("questions"), list
+                                )
+                                else triage_output.get("questions", "")
+                            )
+                            response = agent.process(
+                                self.chat_history,
+                                iteration,
+                                topic=self.topic,
+                                question=question,
+                            )
+                            message = {
+                                "agent": agent.name,
+                                "message": response,
+                                "iteration": iteration,
+                            }
+                            self.chat_history.append(message)
+                            self.log(f"{agent.name}: {response}\n")
 
         # Step 6: Summary Agent summarizes the discussion
-        self.log("📊 Summary Agent is creating a summary...\n")
-        summary = self.summary_agent.process(self.chat_history, self.topic)
-        self.log(f"Summary:\n{summary}\n")
+        with self.tracer.span("summary", "stage"):
+            self.log("📊 Summary Agent is creating a summary...\n")
+            summary = self.summary_agent.process(self.chat_history, self.topic)
+            self.log(f"Summary:\n{summary}\n")
         self.log(
             f"Chat session ended at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
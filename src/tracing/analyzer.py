@@ -0,0 +1,224 @@
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import json
+import argparse
+
+
+class SpanNode:
+    """A complete trace event with its nested child spans."""
+
+    def __init__(self, event: Dict[str, Any]) -> None:
+        self.name = event["name"]
+        self.category = event.get("cat", "")
+        self.start = float(event["ts"])
+        self.duration = float(event.get("dur", 0))
+        self.end = self.start + self.duration
+        self.args = event.get("args", {})
+        self.children: List["SpanNode"] = []
+
+
+class TraceAnalyzer:
+    """Reports the critical path and wall-time shares of a session trace."""
+
+    def __init__(self, trace: Dict[str, Any]) -> None:
+        """
+        Initialize the analyzer.
+
+        Args:
+            trace: A Chrome trace-event document, as written by
+                ChromeTraceFileExporter
+        """
+        events = [
+            e for e in trace.get("traceEvents", []) if e.get("ph") == "X"
+        ]
+        self.roots = self._build_tree(events)
+        if self.roots:
+            self.start = min(r.start for r in self.roots)
+            self.end = max(r.end for r in self.roots)
+        else:
+            self.start = self.end = 0.0
+        self.wall_time = self.end - self.start
+
+    @classmethod
+    def from_file(cls, path: str) -> "TraceAnalyzer":
+        """Load a trace JSON file and build an analyzer for it."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _build_tree(self, events: List[Dict[str, Any]]) -> List[SpanNode]:
+        """Nest spans by time containment, per thread, and return the roots."""
+        roots = []
+        by_thread: Dict[Tuple[Any, Any], List[SpanNode]] = {}
+        for event in events:
+            key = (event.get("pid"), event.get("tid"))
+            by_thread.setdefault(key, []).append(SpanNode(event))
+
+        for nodes in by_thread.values():
+            # Parents sort before their children: earlier start, then longer
+            nodes.sort(key=lambda n: (n.start, -n.duration))
+            stack: List[SpanNode] = []
+            for node in nodes:
+                while stack and node.start >= stack[-1].end:
+                    stack.pop()
+                if stack:
+                    stack[-1].children.append(node)
+                else:
+                    roots.append(node)
+                stack.append(node)
+
+        roots.sort(key=lambda n: n.start)
+        return roots
+
+    def critical_path(self) -> List[Tuple[SpanNode, float, Optional[str]]]:
+        """
+        Find the chain of spans that determined the session's wall time.
+
+        Walks backwards from the end of each span, repeatedly picking the
+        child that finished last before the current point in time.
+
+        Returns:
+            (span, self time on the path, owning agent) tuples in
+            chronological order
+        """
+        path: List[Tuple[SpanNode, float, Optional[str]]] = []
+        for root in self._latest_chain(self.roots, self.end):
+            self._walk(root, path, None)
+        return path
+
+    def _latest_chain(
+        self, spans: List[SpanNode], cursor: float
+    ) -> List[SpanNode]:
+        """Pick the non-overlapping spans that end latest, walking backwards."""
+        chain = []
+        for span in sorted(spans, key=lambda n: n.end, reverse=True):
+            if span.end <= cursor:
+                chain.append(span)
+                cursor = span.start
+        chain.reverse()
+        return chain
+
+    def _walk(
+        self,
+        node: SpanNode,
+        path: List[Tuple[SpanNode, float, Optional[str]]],
+        agent: Optional[str],
+    ) -> None:
+        """Append a span and its critical children to the path."""
+        agent = node.args.get("agent", agent)
+        chain = self._latest_chain(node.children, node.end)
+        self_time = node.duration - sum(c.duration for c in chain)
+        path.append((node, max(self_time, 0.0), agent))
+        for child in chain:
+            self._walk(child, path, agent)
+
+    def stage_shares(self) -> Dict[str, float]:
+        """
+        Sum the time spent in each "stage" span.
+
+        Returns:
+            Dict mapping stage name to its total duration in microseconds
+        """
+        totals: Dict[str, float] = {}
+        for node in self._iter_nodes(self.roots):
+            if node.category == "stage":
+                totals[node.name] = totals.get(node.name, 0.0) + node.duration
+        return totals
+
+    def agent_shares(self) -> Dict[str, float]:
+        """
+        Sum the time attributed to each agent.
+
+        Only the outermost span carrying an "agent" attribute is counted,
+        so nested spans for the same work aren't counted twice.
+
+        Returns:
+            Dict mapping agent name to its total duration in microseconds
+        """
+        totals: Dict[str, float] = {}
+        stack = [(root, False) for root in self.roots]
+        while stack:
+            node, attributed = stack.pop()
+            agent = node.args.get("agent")
+            if agent is not None and not attributed:
+                totals[agent] = totals.get(agent, 0.0) + node.duration
+            stack.extend(
+                (child, attributed or agent is not None)
+                for child in node.children
+            )
+        return totals
+
+    def _iter_nodes(self, nodes: List[SpanNode]):
+        """Yield every span in the tree."""
+        for node in nodes:
+            yield node
+            yield from self._iter_nodes(node.children)
+
+    def report(self, top: Optional[int] = None) -> str:
+        """
+        Format a plain-text report of the trace.
+
+        Args:
+            top: Only list this many critical-path spans, longest first
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"Wall time: {_ms(self.wall_time)}", ""]
+
+        lines.append("Critical path (self time):")
+        path = [p for p in self.critical_path() if p[1] > 0]
+        if top is not None:
+            path = sorted(path, key=lambda p: p[1], reverse=True)[:top]
+        for node, self_time, agent in path:
+            label = node.name
+            if agent is not None:
+                label += f" [{agent}]"
+            lines.append(
+                f"  {label:<40} {_ms(self_time):>12} {self._pct(self_time):>7}"
+            )
+        lines.append("")
+
+        for title, shares in (
+            ("Wall time by stage:", self.stage_shares()),
+            ("Wall time by agent:", self.agent_shares()),
+        ):
+            lines.append(title)
+            for name, total in sorted(
+                shares.items(), key=lambda s: s[1], reverse=True
+            ):
+                lines.append(
+                    f"  {name:<40} {_ms(total):>12} {self._pct(total):>7}"
+                )
+            lines.append("")
+
+        return "\n".join(lines)
+
+    def _pct(self, duration: float) -> str:
+        """Format a duration as a share of the wall time."""
+        if not self.wall_time:
+            return "-"
+        return f"{100 * duration / self.wall_time:.1f}%"
+
+
+def _ms(duration_us: float) -> str:
+    """Format microseconds as milliseconds."""
+    return f"{duration_us / 1000:.1f} ms"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Analyze a chat session trace exported by the chatroom."
+    )
+    parser.add_argument("trace", help="Path to a trace JSON file")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=None,
+        help="Only show the N longest spans on the critical path",
+    )
+    args = parser.parse_args(argv)
+    print(TraceAnalyzer.from_file(args.trace).report(top=args.top))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,127 @@
+from typing import Any, Dict, Iterator, List, Optional
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+class Tracer:
+    """Records timed spans as Chrome trace-event / Perfetto complete events."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Initialize a tracer.
+
+        Args:
+            enabled: When False, spans are no-ops and nothing is recorded
+        """
+        self.enabled = enabled
+        self.events: List[Dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._epoch = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _now_us(self) -> float:
+        """Microseconds elapsed since the tracer was created."""
+        return (time.perf_counter() - self._epoch) * 1_000_000
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = "app", **args: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of code as a single span.
+
+        Spans opened inside another span on the same thread are nested
+        beneath it in the trace viewer.
+
+        Args:
+            name: The name shown for the span
+            category: The trace-event category (e.g. "stage", "llm", "parse")
+            **args: Extra attributes attached to the span
+
+        Yields:
+            The span's args dict, which the caller may add attributes to
+        """
+        if not self.enabled:
+            yield args
+            return
+
+        start = self._now_us()
+        try:
+            yield args
+        except Exception as e:
+            args["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round(start, 3),
+                "dur": round(self._now_us() - start, 3),
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": {k: _jsonable(v) for k, v in args.items()},
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Build a Chrome trace-event document from the recorded spans.
+
+        Returns:
+            A dict that can be serialized as JSON and opened in
+            chrome://tracing or https://ui.perfetto.dev
+        """
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.pid,
+            "tid": 0,
+            "args": {"name": "llm-discussion"},
+        }
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        return {"traceEvents": [metadata] + events, "displayTimeUnit": "ms"}
+
+
+class ChromeTraceFileExporter:
+    """Writes a tracer's spans to a local Chrome trace-event JSON file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            path: The file the trace is written to
+        """
+        self.path = path
+
+    def export(self, tracer: Tracer) -> Optional[str]:
+        """
+        Write the trace to disk.
+
+        Args:
+            tracer: The tracer whose spans should be exported
+
+        Returns:
+            The path written to, or None if the tracer is disabled
+        """
+        if not tracer.enabled:
+            return None
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(tracer.to_chrome_trace(), f)
+        return self.path
+
+
+def _jsonable(value: Any) -> Any:
+    """Coerce a span attribute into something json.dump accepts."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)